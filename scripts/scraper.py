@@ -16,10 +16,18 @@ from bs4 import BeautifulSoup
 import pandas as pd
 import time
 import logging
-from datetime import datetime
+import hashlib
+import json
+import os
+import zlib
+import argparse
+from bisect import bisect_right
+from collections import Counter
+from datetime import datetime, timezone
 from pathlib import Path
 import re
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
+from urllib.parse import urljoin, urldefrag
 
 # Configuração de logging
 logging.basicConfig(
@@ -33,6 +41,320 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+class PageArchive:
+    """
+    Arquivo de páginas brutas com armazenamento endereçado por conteúdo.
+    
+    Cada resposta é identificada pelo SHA-256 do seu conteúdo e guardada uma
+    única vez em `objects/`, comprimida com zlib e um dicionário partilhado
+    treinado sobre páginas da DGES. O manifesto (`manifest.jsonl`) associa
+    cada par (url, data de recolha) ao blob correspondente, permitindo
+    reproduzir qualquer snapshot sem novo acesso ao site.
+    """
+    
+    MANIFEST_NAME = 'manifest.jsonl'
+    DICT_MAX_SIZE = 32 * 1024  # limite do dicionário pré-definido do zlib
+    DICT_TRAINING_SAMPLES = 8  # páginas distintas necessárias para treinar
+    COMPRESSION_LEVEL = 9
+    
+    def __init__(self, archive_dir: str):
+        """
+        Inicializa o arquivo, carregando o manifesto existente.
+        
+        Args:
+            archive_dir: Diretório raiz do arquivo de páginas
+        """
+        self.archive_dir = Path(archive_dir)
+        self.objects_dir = self.archive_dir / 'objects'
+        self.dicts_dir = self.archive_dir / 'dicts'
+        self.manifest_path = self.archive_dir / self.MANIFEST_NAME
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+        self.dicts_dir.mkdir(parents=True, exist_ok=True)
+        
+        self._index: Dict[str, List[Dict]] = {}
+        self._keys: Dict[str, List[str]] = {}
+        self._dicts: Dict[str, bytes] = {}
+        self._samples: List[bytes] = []
+        self.dict_id = ''
+        
+        self._load_dictionaries()
+        self._load_manifest()
+        if not self.dict_id:
+            self._load_samples()
+    
+    def _load_dictionaries(self):
+        """Carrega os dicionários guardados e ativa o mais recente."""
+        latest = None
+        for path in self.dicts_dir.glob('*.dict'):
+            self._dicts[path.stem] = path.read_bytes()
+            if latest is None or path.stat().st_mtime > latest.stat().st_mtime:
+                latest = path
+        if latest is not None:
+            self.dict_id = latest.stem
+    
+    def _load_samples(self):
+        """Recupera blobs já arquivados como amostras para treinar o dicionário."""
+        for path in self.objects_dir.glob('*/*.z'):
+            if len(self._samples) >= self.DICT_TRAINING_SAMPLES:
+                break
+            self._samples.append(self._decompress(path.read_bytes()))
+    
+    def _load_manifest(self):
+        """Reconstrói o índice em memória a partir do manifesto."""
+        if not self.manifest_path.exists():
+            return
+        with open(self.manifest_path, encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    self._add_to_index(json.loads(line))
+    
+    def _add_to_index(self, entry: Dict):
+        """Insere uma entrada do manifesto no índice, ordenada por data."""
+        snapshots = self._index.setdefault(entry['url'], [])
+        keys = self._keys.setdefault(entry['url'], [])
+        key = entry['fetched_at']
+        if not keys or key >= keys[-1]:
+            keys.append(key)
+            snapshots.append(entry)
+        else:
+            position = bisect_right(keys, key)
+            keys.insert(position, key)
+            snapshots.insert(position, entry)
+    
+    @staticmethod
+    def _time_key(moment: datetime) -> str:
+        """Chave ordenável de um instante, normalizada para UTC (datas sem fuso são locais)."""
+        return moment.astimezone(timezone.utc).isoformat(timespec='microseconds')
+    
+    def _blob_path(self, digest: str) -> Path:
+        """Caminho do blob para um digest (subdiretório pelos 2 primeiros caracteres)."""
+        return self.objects_dir / digest[:2] / f'{digest}.z'
+    
+    @staticmethod
+    def _write_atomic(path: Path, data: bytes):
+        """Escreve um ficheiro de forma atómica (ficheiro temporário + rename)."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(path.suffix + '.tmp')
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    
+    def train_dictionary(self, samples: List[bytes]) -> str:
+        """
+        Treina um dicionário partilhado a partir de páginas de exemplo.
+        
+        As linhas presentes em várias páginas (cabeçalhos, menus, rodapés)
+        são as que mais se repetem entre snapshots. São escolhidas por
+        frequência e dispostas pela ordem em que surgem na amostra mais
+        recente, para que blocos contíguos de boilerplate correspondam a
+        uma única referência do zlib.
+        
+        Args:
+            samples: Conteúdos brutos de páginas
+            
+        Returns:
+            Identificador do dicionário ativo (vazio se não houver padrões comuns)
+        """
+        doc_freq = Counter()
+        for sample in samples:
+            doc_freq.update(set(sample.splitlines(keepends=True)))
+        
+        common = [line for line, freq in doc_freq.most_common()
+                  if freq > 1 and line.strip()]
+        
+        selected = set()
+        size = 0
+        for line in common:
+            if size + len(line) > self.DICT_MAX_SIZE:
+                break
+            selected.add(line)
+            size += len(line)
+        
+        if not selected:
+            logger.info("Sem padrões comuns suficientes para treinar dicionário")
+            return self.dict_id
+        
+        chunks = []
+        for sample in reversed(samples):
+            for line in sample.splitlines(keepends=True):
+                if line in selected:
+                    chunks.append(line)
+                    selected.discard(line)
+        
+        zdict = b''.join(chunks)
+        dict_id = hashlib.sha256(zdict).hexdigest()[:16]
+        self._write_atomic(self.dicts_dir / f'{dict_id}.dict', zdict)
+        self._dicts[dict_id] = zdict
+        self.dict_id = dict_id
+        logger.info(f"Dicionário de compressão treinado: {dict_id} ({len(zdict)} bytes)")
+        return dict_id
+    
+    def _compress(self, content: bytes) -> bytes:
+        """Comprime o conteúdo com o dicionário ativo, prefixando o seu id."""
+        if self.dict_id:
+            compressor = zlib.compressobj(self.COMPRESSION_LEVEL,
+                                          zdict=self._dicts[self.dict_id])
+        else:
+            compressor = zlib.compressobj(self.COMPRESSION_LEVEL)
+        body = compressor.compress(content) + compressor.flush()
+        return self.dict_id.encode('ascii') + b'\n' + body
+    
+    def _decompress(self, blob: bytes) -> bytes:
+        """Descomprime um blob usando o dicionário indicado no cabeçalho."""
+        dict_id, _, body = blob.partition(b'\n')
+        dict_id = dict_id.decode('ascii')
+        if dict_id:
+            decompressor = zlib.decompressobj(zdict=self._dicts[dict_id])
+        else:
+            decompressor = zlib.decompressobj()
+        return decompressor.decompress(body) + decompressor.flush()
+    
+    def store(self, url: str, content: bytes, fetched_at: Optional[datetime] = None) -> str:
+        """
+        Arquiva uma resposta bruta, guardando o blob apenas se for novo.
+        
+        Args:
+            url: URL da página
+            content: Conteúdo bruto da resposta
+            fetched_at: Momento da recolha (por omissão, agora; guardado em UTC)
+            
+        Returns:
+            Digest SHA-256 do conteúdo
+        """
+        if fetched_at is None:
+            fetched_at = datetime.now(timezone.utc)
+        
+        digest = hashlib.sha256(content).hexdigest()
+        blob_path = self._blob_path(digest)
+        
+        if not blob_path.exists():
+            if not self.dict_id:
+                self._samples.append(content)
+                if len(self._samples) >= self.DICT_TRAINING_SAMPLES:
+                    self.train_dictionary(self._samples)
+                    self._samples = []
+            self._write_atomic(blob_path, self._compress(content))
+        
+        entry = {
+            'url': url,
+            'fetched_at': self._time_key(fetched_at),
+            'sha256': digest,
+            'size': len(content),
+        }
+        with open(self.manifest_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+        self._add_to_index(entry)
+        
+        return digest
+    
+    def load(self, digest: str) -> bytes:
+        """
+        Lê o conteúdo bruto de um blob.
+        
+        Args:
+            digest: Digest SHA-256 do conteúdo
+            
+        Returns:
+            Conteúdo original da página
+        """
+        return self._decompress(self._blob_path(digest).read_bytes())
+    
+    def snapshots(self, url: str) -> List[Dict]:
+        """
+        Lista os snapshots arquivados de um URL, por ordem cronológica.
+        
+        Args:
+            url: URL da página
+            
+        Returns:
+            Lista de entradas do manifesto
+        """
+        return list(self._index.get(url, []))
+    
+    def load_snapshot(self, url: str, at: Optional[datetime] = None) -> Optional[bytes]:
+        """
+        Obtém o snapshot de um URL tal como estava num dado momento.
+        
+        Args:
+            url: URL da página
+            at: Momento pretendido (por omissão, o snapshot mais recente)
+            
+        Returns:
+            Conteúdo bruto ou None se não existir snapshot até esse momento
+        """
+        snapshots = self._index.get(url)
+        if not snapshots:
+            return None
+        
+        if at is None:
+            position = len(snapshots)
+        else:
+            position = bisect_right(self._keys[url], self._time_key(at))
+        
+        if position == 0:
+            return None
+        return self.load(snapshots[position - 1]['sha256'])
+    
+    def stats(self) -> Dict:
+        """
+        Calcula estatísticas de ocupação do arquivo.
+        
+        Returns:
+            Dicionário com número de snapshots, blobs e bytes brutos/em disco
+        """
+        entries = [e for snapshots in self._index.values() for e in snapshots]
+        blobs = list(self.objects_dir.glob('*/*.z'))
+        return {
+            'snapshots': len(entries),
+            'blobs': len(blobs),
+            'raw_bytes': sum(e['size'] for e in entries),
+            'stored_bytes': sum(p.stat().st_size for p in blobs),
+        }
+
+
+class AdaptivePoller:
+    """
+    Calcula o intervalo entre verificações no modo de vigilância.
+    
+    Quando é detetada uma alteração (a DGES está a publicar), o intervalo
+    volta ao mínimo; enquanto o conteúdo se mantém estável, cresce
+    geometricamente até ao máximo.
+    """
+    
+    BACKOFF_FACTOR = 2.0
+    
+    def __init__(self, min_interval: float, max_interval: float):
+        """
+        Inicializa o poller.
+        
+        Args:
+            min_interval: Intervalo mínimo em segundos
+            max_interval: Intervalo máximo em segundos
+        """
+        if min_interval <= 0 or max_interval < min_interval:
+            raise ValueError("Intervalos inválidos: requer 0 < min_interval <= max_interval")
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.interval = min_interval
+    
+    def update(self, changed: bool) -> float:
+        """
+        Ajusta o intervalo consoante o resultado da última verificação.
+        
+        Args:
+            changed: True se foram detetadas alterações
+            
+        Returns:
+            Intervalo em segundos até à próxima verificação
+        """
+        if changed:
+            self.interval = self.min_interval
+        else:
+            self.interval = min(self.interval * self.BACKOFF_FACTOR, self.max_interval)
+        return self.interval
+
+
 class DGESScraper:
     """
     Scraper ético para o site da DGES focado em dados do IPT.
@@ -48,6 +370,13 @@ class DGESScraper:
     REQUEST_DELAY = 1.5  # segundos entre requisições
     TIMEOUT = 30  # timeout para requisições HTTP
     
+    # Modo de vigilância
+    INDEX_URLS = [BASE_URL]  # páginas de índice verificadas em cada ciclo
+    WATCH_MIN_INTERVAL = 60  # segundos, durante publicações
+    WATCH_MAX_INTERVAL = 600  # segundos; limita a deteção de novas publicações a ~10 min
+    WATCH_MAX_ATTEMPTS = 5  # tentativas por página antes de desistir
+    RETRYABLE_STATUS = {408, 429}  # erros 4xx temporários
+    
     # Códigos de instituição do IPT
     IPT_CODES = ['3100', '3101', '3102', '3103', '3104', '3105']
     IPT_NAME_PATTERNS = [
@@ -57,16 +386,19 @@ class DGESScraper:
         'ipt'
     ]
     
-    def __init__(self, output_dir: str = 'data'):
+    def __init__(self, output_dir: str = 'data', archive_dir: Optional[str] = None):
         """
         Inicializa o scraper.
         
         Args:
             output_dir: Diretório onde os dados serão salvos
+            archive_dir: Diretório do arquivo de páginas brutas (opcional)
         """
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
         
+        self.archive = PageArchive(archive_dir) if archive_dir else None
+        
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'IPT-Research-Bot/1.0 (Educational Purpose; mestrado CS project)',
@@ -76,6 +408,13 @@ class DGESScraper:
         
         self.data_collected = []
         
+        # Estado mantido entre ciclos do modo de vigilância
+        self._validators: Dict[str, Dict[str, str]] = {}
+        self._page_hashes: Dict[str, str] = {}
+        self._listings: Dict[str, Dict[str, str]] = {}
+        self.records_by_page: Dict[str, List[Dict]] = {}
+        self.pending_retries: Dict[str, int] = {}
+        
     def respect_robots_txt(self) -> bool:
         """
         Verifica e respeita o arquivo robots.txt do site.
@@ -117,6 +456,9 @@ class DGESScraper:
             response = self.session.get(url, params=params, timeout=self.TIMEOUT)
             response.raise_for_status()
             
+            if self.archive is not None:
+                self.archive.store(response.url, response.content)
+            
             return BeautifulSoup(response.content, 'lxml')
             
         except requests.exceptions.RequestException as e:
@@ -286,6 +628,266 @@ class DGESScraper:
             logger.error(f"Erro ao salvar CSV: {e}")
             raise
     
+    def fetch_if_changed(self, url: str) -> Tuple[bool, Optional[BeautifulSoup]]:
+        """
+        Busca uma página apenas se tiver mudado desde a última visita.
+        
+        Usa pedidos condicionais (ETag/Last-Modified) quando o servidor os
+        suporta e compara o hash do conteúdo nos restantes casos.
+        
+        Args:
+            url: URL para buscar
+            
+        Returns:
+            Tuplo (alterada, BeautifulSoup); o soup é None se não mudou ou em erro
+        """
+        headers = {}
+        validators = self._validators.get(url, {})
+        if 'etag' in validators:
+            headers['If-None-Match'] = validators['etag']
+        if 'last_modified' in validators:
+            headers['If-Modified-Since'] = validators['last_modified']
+        
+        try:
+            time.sleep(self.REQUEST_DELAY)  # Delay ético
+            
+            logger.info(f"Verificando: {url}")
+            response = self.session.get(url, headers=headers, timeout=self.TIMEOUT)
+            if response.status_code == 304:
+                return False, None
+            response.raise_for_status()
+            
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Erro ao buscar {url}: {e}")
+            return False, None
+        
+        validators = {}
+        if response.headers.get('ETag'):
+            validators['etag'] = response.headers['ETag']
+        if response.headers.get('Last-Modified'):
+            validators['last_modified'] = response.headers['Last-Modified']
+        self._validators[url] = validators
+        
+        digest = hashlib.sha256(response.content).hexdigest()
+        if self._page_hashes.get(url) == digest:
+            return False, None
+        self._page_hashes[url] = digest
+        
+        if self.archive is not None:
+            self.archive.store(response.url, response.content)
+        
+        return True, BeautifulSoup(response.content, 'lxml')
+    
+    def extract_listing(self, soup: BeautifulSoup, page_url: str) -> Dict[str, str]:
+        """
+        Extrai a listagem de ligações de uma página de índice.
+        
+        Cada ligação é associada a uma impressão digital do texto da linha
+        onde aparece (ex.: data de atualização), para detetar alterações
+        sem buscar a página de destino.
+        
+        Args:
+            soup: Página de índice
+            page_url: URL da página de índice (para resolver ligações relativas)
+            
+        Returns:
+            Dicionário {url da ligação: impressão digital da entrada}
+        """
+        listing = {}
+        for link in soup.find_all('a', href=True):
+            url, _ = urldefrag(urljoin(page_url, link['href']))
+            if not url.startswith(self.BASE_URL) or url in self.INDEX_URLS:
+                continue
+            
+            row = link.find_parent('tr') or link.parent
+            text = ' '.join(row.get_text(' ').split())
+            fingerprint = hashlib.sha256(text.encode('utf-8')).hexdigest()
+            # Ligações repetidas numa página combinam as suas entradas
+            listing[url] = hashlib.sha256(
+                (listing.get(url, '') + fingerprint).encode('ascii')
+            ).hexdigest()
+        return listing
+    
+    def _fetch_listed_page(self, url: str) -> Tuple[Optional[BeautifulSoup], bool]:
+        """
+        Busca uma página da listagem, distinguindo falhas temporárias.
+        
+        Args:
+            url: URL para buscar
+            
+        Returns:
+            Tuplo (BeautifulSoup ou None, True se a falha justifica nova tentativa)
+        """
+        try:
+            time.sleep(self.REQUEST_DELAY)  # Delay ético
+            
+            logger.info(f"Buscando: {url}")
+            response = self.session.get(url, timeout=self.TIMEOUT)
+            response.raise_for_status()
+            
+        except requests.exceptions.HTTPError as e:
+            logger.error(f"Erro ao buscar {url}: {e}")
+            status = e.response.status_code if e.response is not None else None
+            return None, status is None or status >= 500 or status in self.RETRYABLE_STATUS
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Erro ao buscar {url}: {e}")
+            return None, True
+        
+        if self.archive is not None:
+            self.archive.store(response.url, response.content)
+        
+        return BeautifulSoup(response.content, 'lxml'), True
+    
+    def parse_page(self, url: str, soup: BeautifulSoup) -> List[Dict]:
+        """
+        Extrai registos de uma página de resultados.
+        
+        Tal como scrape_courses(), é um placeholder que precisará ser
+        adaptado à estrutura real das páginas da DGES.
+        
+        Args:
+            url: URL da página
+            soup: Conteúdo da página
+            
+        Returns:
+            Lista de dicionários com os registos da página
+        """
+        return []
+    
+    def poll_once(self) -> Tuple[List[str], List[str]]:
+        """
+        Executa um ciclo de vigilância sobre as páginas de índice.
+        
+        Só as páginas cuja entrada na listagem mudou (ou é nova) são
+        buscadas e processadas; as removidas deixam de contribuir. Páginas
+        com falhas temporárias ficam em `pending_retries` e são repetidas
+        nos ciclos seguintes, até WATCH_MAX_ATTEMPTS tentativas.
+        
+        Returns:
+            Tuplo (URLs atualizados, URLs removidos da listagem)
+        """
+        updated = []
+        removed = []
+        to_fetch = []
+        
+        for index_url in self.INDEX_URLS:
+            changed, soup = self.fetch_if_changed(index_url)
+            if not changed:
+                continue
+            
+            previous = self._listings.get(index_url, {})
+            listing = self.extract_listing(soup, index_url)
+            self._listings[index_url] = listing
+            
+            for url in previous.keys() - listing.keys():
+                self.records_by_page.pop(url, None)
+                self.pending_retries.pop(url, None)
+                removed.append(url)
+            
+            to_fetch.extend(url for url, fingerprint in listing.items()
+                            if previous.get(url) != fingerprint and url not in to_fetch)
+        
+        # Novas tentativas não dependem de alterações no índice
+        to_fetch.extend(url for url in self.pending_retries if url not in to_fetch)
+        
+        for url in to_fetch:
+            page, retryable = self._fetch_listed_page(url)
+            if page is None:
+                attempts = self.pending_retries.pop(url, 0) + 1
+                if retryable and attempts < self.WATCH_MAX_ATTEMPTS:
+                    self.pending_retries[url] = attempts
+                else:
+                    logger.error(f"Desistindo de {url} após {attempts} tentativa(s)")
+                continue
+            self.pending_retries.pop(url, None)
+            
+            records = [
+                self.anonymize_student_data(record)
+                for record in self.parse_page(url, page)
+                if self.is_ipt_institution(record.get('instituicao', ''),
+                                           record.get('codigo_instituicao', ''))
+            ]
+            self.records_by_page[url] = records
+            updated.append(url)
+        
+        return updated, removed
+    
+    def watch(self, min_interval: float = None, max_interval: float = None,
+              max_cycles: Optional[int] = None) -> Optional[Path]:
+        """
+        Executa o scraper em modo de vigilância contínua.
+        
+        Mantém a sessão e o estado entre ciclos, verificando as páginas de
+        índice com intervalos adaptativos e publicando um novo CSV sempre
+        que há páginas atualizadas ou removidas.
+        
+        Args:
+            min_interval: Intervalo mínimo entre ciclos (segundos)
+            max_interval: Intervalo máximo entre ciclos (segundos)
+            max_cycles: Número máximo de ciclos (None para correr indefinidamente)
+            
+        Returns:
+            Path do último CSV publicado ou None se nada foi publicado
+        """
+        if min_interval is None:
+            min_interval = self.WATCH_MIN_INTERVAL
+        if max_interval is None:
+            max_interval = self.WATCH_MAX_INTERVAL
+        poller = AdaptivePoller(min_interval, max_interval)
+        
+        logger.info("=" * 60)
+        logger.info("Iniciando modo de vigilância DGES - IPT")
+        logger.info("=" * 60)
+        
+        if not self.respect_robots_txt():
+            logger.error("Scraping não permitido por robots.txt")
+            return None
+        
+        output_file = None
+        needs_publish = False
+        cycle = 0
+        while max_cycles is None or cycle < max_cycles:
+            cycle += 1
+            
+            # Um erro num ciclo não deve terminar o processo nem perder o estado
+            try:
+                updated, removed = self.poll_once()
+                if updated or removed:
+                    logger.info(f"{len(updated)} página(s) atualizada(s), "
+                                f"{len(removed)} removida(s)")
+                    needs_publish = True
+                
+                if needs_publish:
+                    data = [record for records in self.records_by_page.values()
+                            for record in records]
+                    
+                    if data or output_file is not None:
+                        # Republicar mesmo vazio para retirar dados já publicados
+                        output_file = self.save_to_csv(data)
+                    else:
+                        logger.warning("Nenhum dado foi coletado nas páginas atualizadas!")
+                        logger.info("Adapte o método parse_page() à estrutura real do site")
+                    needs_publish = False
+                
+                if self.pending_retries:
+                    logger.warning(f"{len(self.pending_retries)} página(s) por obter, "
+                                   f"nova tentativa no próximo ciclo")
+                
+                # Novas tentativas pendentes contam como publicação em curso
+                changed = bool(updated or removed or self.pending_retries)
+                
+            except Exception as e:
+                logger.error(f"Erro no ciclo de vigilância: {e}")
+                changed = False
+            
+            interval = poller.update(changed)
+            if max_cycles is not None and cycle >= max_cycles:
+                break
+            logger.info(f"Próxima verificação em {interval:.0f}s")
+            time.sleep(interval)
+        
+        return output_file
+    
     def run(self) -> Path:
         """
         Executa o processo completo de scraping.
@@ -335,10 +937,27 @@ class DGESScraper:
 
 def main():
     """Função principal."""
+    parser = argparse.ArgumentParser(description="Web Scraper DGES - IPT")
+    parser.add_argument('--output-dir', default='data',
+                        help="diretório onde os dados serão salvos")
+    parser.add_argument('--archive-dir',
+                        help="diretório do arquivo de páginas brutas")
+    parser.add_argument('--watch', action='store_true',
+                        help="modo de vigilância contínua com polling adaptativo")
+    parser.add_argument('--min-interval', type=float, default=DGESScraper.WATCH_MIN_INTERVAL,
+                        help="intervalo mínimo entre verificações (segundos)")
+    parser.add_argument('--max-interval', type=float, default=DGESScraper.WATCH_MAX_INTERVAL,
+                        help="intervalo máximo entre verificações (segundos)")
+    args = parser.parse_args()
+    
     try:
-        scraper = DGESScraper(output_dir='data')
-        output_file = scraper.run()
-        print(f"\n✓ Dados salvos em: {output_file}")
+        scraper = DGESScraper(output_dir=args.output_dir, archive_dir=args.archive_dir)
+        if args.watch:
+            output_file = scraper.watch(args.min_interval, args.max_interval)
+        else:
+            output_file = scraper.run()
+        if output_file is not None:
+            print(f"\n✓ Dados salvos em: {output_file}")
         
     except KeyboardInterrupt:
         logger.info("\nScraping interrompido pelo utilizador")
@@ -8,12 +8,18 @@ requisições reais ao site.
 """
 
 import sys
+import tempfile
+import zlib
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 # Adicionar scripts ao path
 sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
 
-from scraper import DGESScraper
+import requests
+
+import scraper as scraper_module
+from scraper import AdaptivePoller, DGESScraper, PageArchive
 
 
 def test_ipt_institution_detection():
@@ -98,6 +104,250 @@ def test_data_structure():
     print("✓ Testes de estrutura de dados passaram")
 
 
+def test_page_archive_deduplication():
+    """Testa a deduplicação e reprodução de snapshots no arquivo de páginas."""
+    archive_dir = tempfile.mkdtemp()
+    archive = PageArchive(archive_dir)
+    
+    url = 'https://dges.gov.pt/coloc/2025/col1listas.asp'
+    page_v1 = '<html><body>Cabeçalho DGES\n<p>Colocados: 28</p></body></html>'.encode('utf-8')
+    page_v2 = '<html><body>Cabeçalho DGES\n<p>Colocados: 30</p></body></html>'.encode('utf-8')
+    
+    digest = archive.store(url, page_v1, datetime(2025, 9, 1, 10))
+    assert archive.store(url, page_v1, datetime(2025, 9, 1, 11)) == digest
+    archive.store(url, page_v2, datetime(2025, 9, 1, 12))
+    
+    stats = archive.stats()
+    assert stats['snapshots'] == 3
+    assert stats['blobs'] == 2
+    
+    # Reprodução por momento e leitura após reabrir o arquivo
+    assert archive.load_snapshot(url, datetime(2025, 9, 1, 11, 30)) == page_v1
+    assert archive.load_snapshot(url, datetime(2025, 9, 1, 9)) is None
+    reopened = PageArchive(archive_dir)
+    assert reopened.load_snapshot(url) == page_v2
+    assert len(reopened.snapshots(url)) == 3
+    
+    # Instantes com fuso horário são comparados em UTC
+    moment = datetime(2025, 9, 1, 11, 30).astimezone()
+    assert archive.load_snapshot(url, moment.astimezone(timezone(timedelta(hours=-5)))) == page_v1
+    
+    print("✓ Testes de deduplicação do arquivo passaram")
+
+
+def test_page_archive_dictionary():
+    """Testa o treino e uso do dicionário de compressão partilhado."""
+    archive_dir = tempfile.mkdtemp()
+    
+    boilerplate = b''.join(b'<li><a href="/menu%d">Menu DGES %d</a></li>\n' % (i, i)
+                           for i in range(200))
+    pages = [boilerplate + b'<p>Curso %d</p>\n' % i for i in range(PageArchive.DICT_TRAINING_SAMPLES + 2)]
+    
+    # Uma página nova por execução, como no uso via cron
+    digests = [PageArchive(archive_dir).store(f'https://dges.gov.pt/coloc/2025/curso{i}', page)
+               for i, page in enumerate(pages)]
+    
+    archive = PageArchive(archive_dir)
+    assert archive.dict_id
+    for i, page in enumerate(pages):
+        assert archive.load_snapshot(f'https://dges.gov.pt/coloc/2025/curso{i}') == page
+    
+    # Blobs guardados antes do treino usam zlib simples; os seguintes usam o dicionário
+    before = archive._blob_path(digests[0]).stat().st_size
+    after = archive._blob_path(digests[-1]).stat().st_size
+    baseline = len(zlib.compress(pages[-1], PageArchive.COMPRESSION_LEVEL))
+    assert before >= baseline
+    assert after < baseline / 4
+    
+    print("✓ Testes de dicionário de compressão passaram")
+
+
+def test_adaptive_poller():
+    """Testa o ajuste adaptativo do intervalo de vigilância."""
+    poller = AdaptivePoller(min_interval=60, max_interval=300)
+    
+    # Conteúdo estável: recuo geométrico até ao máximo
+    assert poller.update(False) == 120
+    assert poller.update(False) == 240
+    assert poller.update(False) == 300
+    assert poller.update(False) == 300
+    
+    # Publicação detetada: volta ao mínimo
+    assert poller.update(True) == 60
+    
+    print("✓ Testes de polling adaptativo passaram")
+
+
+def make_response(url, status=200, content=b'', headers=None):
+    """Cria uma resposta HTTP simulada."""
+    response = requests.Response()
+    response.url = url
+    response.status_code = status
+    response._content = content
+    response.headers.update(headers or {})
+    return response
+
+
+def make_index(names):
+    """Cria o HTML de uma página de índice com uma ligação por nome."""
+    rows = ''.join(f'<tr><td><a href="{name}.asp">{name}</a></td></tr>' for name in names)
+    return f'<html><table>{rows}</table></html>'.encode('utf-8')
+
+
+def test_fetch_if_changed_conditional_requests():
+    """Testa os pedidos condicionais e a deteção de conteúdo inalterado."""
+    scraper = DGESScraper(output_dir='/tmp')
+    scraper.REQUEST_DELAY = 0
+    url = scraper.BASE_URL
+    
+    sent_headers = []
+    responses = [
+        make_response(url, 200, b'<p>v1</p>', {'ETag': '"v1"'}),
+        make_response(url, 304),
+        make_response(url, 200, b'<p>v1</p>'),
+        make_response(url, 200, b'<p>v2</p>', {'Last-Modified': 'Mon, 01 Sep 2025 10:00:00 GMT'}),
+    ]
+    
+    def fake_get(request_url, headers=None, **kwargs):
+        sent_headers.append(dict(headers or {}))
+        return responses.pop(0)
+    
+    scraper.session.get = fake_get
+    
+    changed, soup = scraper.fetch_if_changed(url)
+    assert changed and soup is not None
+    assert sent_headers[0] == {}
+    
+    # 304: não alterada, com o ETag enviado
+    assert scraper.fetch_if_changed(url) == (False, None)
+    assert sent_headers[1] == {'If-None-Match': '"v1"'}
+    
+    # Sem validadores, mas conteúdo idêntico: ignorada pelo hash
+    assert scraper.fetch_if_changed(url) == (False, None)
+    
+    changed, soup = scraper.fetch_if_changed(url)
+    assert changed
+    assert scraper._validators[url] == {
+        'last_modified': 'Mon, 01 Sep 2025 10:00:00 GMT'
+    }
+    
+    print("✓ Testes de pedidos condicionais passaram")
+
+
+def test_watch_publishes_updates_and_retries():
+    """Testa o modo de vigilância: novas tentativas, republicação e intervalos."""
+    scraper = DGESScraper(output_dir=tempfile.mkdtemp())
+    scraper.REQUEST_DELAY = 0
+    base = scraper.BASE_URL
+    
+    # Estado do site em cada ciclo: índice (None = 304) e estado das páginas
+    cycles = [
+        (make_index(['a', 'b', 'c']), {'b': 500, 'c': 404}),
+        (None, {'b': 500}),
+        (None, {}),
+        (make_index(['a', 'c']), {'c': 404}),
+        (None, {}),
+        (None, {}),
+    ]
+    requested = []
+    
+    def fake_get(url, headers=None, **kwargs):
+        requested.append((url, dict(headers or {})))
+        index, statuses = cycles[0]
+        if url == base:
+            if index is None:
+                return make_response(url, 304)
+            return make_response(url, 200, index, {'ETag': str(len(requested))})
+        if url.endswith('robots.txt'):
+            return make_response(url, 200)
+        name = url[len(base):-len('.asp')]
+        return make_response(url, statuses.get(name, 200), f'<p>{name}</p>'.encode('utf-8'))
+    
+    # Apenas a página 'b' tem registos do IPT
+    scraper.parse_page = lambda url, soup: (
+        [{'instituicao': 'Instituto Politécnico de Tomar', 'curso': 'B'}] if url.endswith('b.asp') else []
+    )
+    
+    published = []
+    save_to_csv = scraper.save_to_csv
+    scraper.save_to_csv = lambda data, filename=None: published.append(list(data)) or save_to_csv(data, filename)
+    
+    sleeps = []
+    
+    def fake_sleep(seconds):
+        sleeps.append(seconds)
+        if seconds >= 10:
+            cycles.pop(0)
+    
+    scraper.session.get = fake_get
+    original_sleep = scraper_module.time.sleep
+    scraper_module.time.sleep = fake_sleep
+    try:
+        output_file = scraper.watch(min_interval=10, max_interval=40, max_cycles=6)
+    finally:
+        scraper_module.time.sleep = original_sleep
+    
+    page_requests = [url[len(base):] for url, _ in requested if url.endswith('.asp')]
+    # 'c' (404) não é repetida; 'b' (500) é repetida até ser obtida; 'a' só uma vez
+    assert page_requests == ['a.asp', 'b.asp', 'c.asp', 'b.asp', 'b.asp']
+    
+    # Pedidos ao índice após o primeiro são condicionais
+    index_headers = [headers for url, headers in requested if url == base]
+    assert index_headers[0] == {}
+    assert all('If-None-Match' in headers for headers in index_headers[1:])
+    
+    # Sem dados no 1.º ciclo não há CSV; 'b' publicado no 3.º; remoção republica vazio
+    assert published == [[{'instituicao': 'Instituto Politécnico de Tomar', 'curso': 'B'}], []]
+    assert output_file is not None
+    
+    # Novas tentativas pendentes mantêm o intervalo mínimo; depois há recuo
+    assert [s for s in sleeps if s >= 10] == [10, 10, 10, 10, 20]
+    
+    print("✓ Testes do modo de vigilância passaram")
+
+
+def test_watch_gives_up_and_survives_errors():
+    """Testa o limite de tentativas e a recuperação de erros num ciclo."""
+    scraper = DGESScraper(output_dir='/tmp')
+    scraper.REQUEST_DELAY = 0
+    base = scraper.BASE_URL
+    
+    index = make_index(['a'])
+    scraper.session.get = lambda url, headers=None, **kwargs: (
+        make_response(url, 200, index) if url == base else make_response(url, 503)
+    )
+    
+    for attempt in range(1, DGESScraper.WATCH_MAX_ATTEMPTS):
+        assert scraper.poll_once() == ([], [])
+        assert scraper.pending_retries == {base + 'a.asp': attempt}
+    assert scraper.poll_once() == ([], [])
+    assert scraper.pending_retries == {}
+    
+    # Um erro inesperado num ciclo é registado e o ciclo seguinte prossegue
+    outcomes = [OSError("disco cheio"), ([base + 'a.asp'], [])]
+    
+    def flaky_poll():
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+    
+    sleeps = []
+    scraper.respect_robots_txt = lambda: True
+    scraper.poll_once = flaky_poll
+    original_sleep = scraper_module.time.sleep
+    scraper_module.time.sleep = sleeps.append
+    try:
+        scraper.watch(min_interval=10, max_interval=40, max_cycles=2)
+    finally:
+        scraper_module.time.sleep = original_sleep
+    
+    assert outcomes == []
+    assert sleeps == [20]
+    
+    print("✓ Testes de limite de tentativas e recuperação passaram")
+
+
 def run_all_tests():
     """Executa todos os testes."""
     print("=" * 60)
@@ -109,6 +359,12 @@ def run_all_tests():
         test_ipt_institution_detection()
         test_anonymization()
         test_data_structure()
+        test_page_archive_deduplication()
+        test_page_archive_dictionary()
+        test_adaptive_poller()
+        test_fetch_if_changed_conditional_requests()
+        test_watch_publishes_updates_and_retries()
+        test_watch_gives_up_and_survives_errors()
         
         print("=" * 60)
         print("✓ TODOS OS TESTES PASSARAM")